@@ -6,6 +6,10 @@ from volcenginesdkvpc.api.vpc_api import VPCApi
 from volcenginesdkvpc.models import DescribeVpcsRequest, DescribeVpcsResponse, DescribeSubnetsRequest, DescribeSubnetsResponse
 
 
+# 长连接池大小：默认值只有4，并发工具调用时会排队新建TCP+TLS连接
+_CONNECTION_POOL_MAXSIZE = 32
+
+
 class RDSMySQLSDK:
     """初始化 volc RDS MySQL client"""
 
@@ -14,34 +18,40 @@ class RDSMySQLSDK:
         configuration.ak = ak
         configuration.sk = sk
         configuration.region = region
+        configuration.connection_pool_maxsize = _CONNECTION_POOL_MAXSIZE
         if host is not None:
             configuration.host = host
         self.client = RDSMYSQLV2Api(volcenginesdkcore.ApiClient(configuration, "X-Rdsmgr-Source", "mcp_local"))
         self.vpcClient = VPCApi(volcenginesdkcore.ApiClient(configuration))
 
-    def describe_db_instances(self, args: dict) -> models.DescribeDBInstancesResponse:
-        return self.client.describe_db_instances(models.DescribeDBInstancesRequest(**args))
+    def _call(self, method, request, raw: bool = False):
+        """raw=True时在本层把类型化响应展平成dict返回，错误拦截器照常生效"""
+        resp = method(request)
+        return resp.to_dict() if raw else resp
+
+    def describe_db_instances(self, args: dict, raw: bool = False) -> models.DescribeDBInstancesResponse | dict:
+        return self._call(self.client.describe_db_instances, models.DescribeDBInstancesRequest(**args), raw)
 
-    def describe_db_instance_detail(self, args: dict) -> models.DescribeDBInstanceDetailResponse:
-        return self.client.describe_db_instance_detail(models.DescribeDBInstanceDetailRequest(**args))
+    def describe_db_instance_detail(self, args: dict, raw: bool = False) -> models.DescribeDBInstanceDetailResponse | dict:
+        return self._call(self.client.describe_db_instance_detail, models.DescribeDBInstanceDetailRequest(**args), raw)
 
-    def describe_db_instance_engine_minor_versions(self, args: dict) -> models.DescribeDBInstanceEngineMinorVersionsResponse:
-        return self.client.describe_db_instance_engine_minor_versions(models.DescribeDBInstanceEngineMinorVersionsRequest(**args))
+    def describe_db_instance_engine_minor_versions(self, args: dict, raw: bool = False) -> models.DescribeDBInstanceEngineMinorVersionsResponse | dict:
+        return self._call(self.client.describe_db_instance_engine_minor_versions, models.DescribeDBInstanceEngineMinorVersionsRequest(**args), raw)
 
-    def describe_db_accounts(self, args: dict) -> models.DescribeDBAccountsResponse:
-        return self.client.describe_db_accounts(models.DescribeDBAccountsRequest(**args))
+    def describe_db_accounts(self, args: dict, raw: bool = False) -> models.DescribeDBAccountsResponse | dict:
+        return self._call(self.client.describe_db_accounts, models.DescribeDBAccountsRequest(**args), raw)
 
-    def describe_databases(self, args: dict) -> models.DescribeDatabasesResponse:
-        return self.client.describe_databases(models.DescribeDatabasesRequest(**args))
+    def describe_databases(self, args: dict, raw: bool = False) -> models.DescribeDatabasesResponse | dict:
+        return self._call(self.client.describe_databases, models.DescribeDatabasesRequest(**args), raw)
 
-    def describe_db_instance_parameters(self, args: dict) -> models.DescribeDBInstanceParametersResponse:
-        return self.client.describe_db_instance_parameters(models.DescribeDBInstanceParametersRequest(**args))
+    def describe_db_instance_parameters(self, args: dict, raw: bool = False) -> models.DescribeDBInstanceParametersResponse | dict:
+        return self._call(self.client.describe_db_instance_parameters, models.DescribeDBInstanceParametersRequest(**args), raw)
 
-    def list_parameter_templates(self, args: dict) -> models.ListParameterTemplatesResponse:
-        return self.client.list_parameter_templates(models.ListParameterTemplatesRequest(**args))
+    def list_parameter_templates(self, args: dict, raw: bool = False) -> models.ListParameterTemplatesResponse | dict:
+        return self._call(self.client.list_parameter_templates, models.ListParameterTemplatesRequest(**args), raw)
 
-    def describe_parameter_template(self, args: dict) -> models.DescribeParameterTemplateResponse:
-        return self.client.describe_parameter_template(models.DescribeParameterTemplateRequest(**args))
+    def describe_parameter_template(self, args: dict, raw: bool = False) -> models.DescribeParameterTemplateResponse | dict:
+        return self._call(self.client.describe_parameter_template, models.DescribeParameterTemplateRequest(**args), raw)
 
     def create_db_instance(self, args: dict) -> models.CreateDBInstanceResponse:
         return self.client.create_db_instance(models.CreateDBInstanceRequest(**args))
@@ -67,10 +77,8 @@ class RDSMySQLSDK:
     def describe_db_instance_price_detail(self, args: dict) -> models.DescribeDBInstancePriceDetailResponse:
         return self.client.describe_db_instance_price_detail(models.DescribeDBInstancePriceDetailRequest(**args))
 
-    def describe_vpcs(self, args: dict) -> DescribeVpcsResponse:
-        return self.vpcClient.describe_vpcs(DescribeVpcsRequest(**args))
-
-    def describe_subnets(self, args: dict) -> DescribeSubnetsResponse:
-        return self.vpcClient.describe_subnets(DescribeSubnetsRequest(**args))
-
+    def describe_vpcs(self, args: dict, raw: bool = False) -> DescribeVpcsResponse | dict:
+        return self._call(self.vpcClient.describe_vpcs, DescribeVpcsRequest(**args), raw)
 
+    def describe_subnets(self, args: dict, raw: bool = False) -> DescribeSubnetsResponse | dict:
+        return self._call(self.vpcClient.describe_subnets, DescribeSubnetsRequest(**args), raw)
@@ -1,5 +1,10 @@
 import os
+import time
 import asyncio
+import inspect
+import functools
+import threading
+from dataclasses import dataclass
 from pydantic import Field
 import logging
 import argparse
@@ -7,21 +12,194 @@ from mcp.server.fastmcp import FastMCP
 from mcp_server_rds_mysql.resource.rds_mysql_resource import RDSMySQLSDK
 from typing import List, Dict, Any, Optional
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:  # orjson未安装时退回标准库
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
 # 初始化MCP服务
 mcp_server = FastMCP("rds_mysql_mcp_server", port=int(os.getenv("MCP_SERVER_PORT", "8000")))
 logger = logging.getLogger("rds_mysql_mcp_server")
 
-rds_mysql_resource = RDSMySQLSDK(
-    region=os.getenv('VOLCENGINE_REGION',"cn-beijing"), ak=os.getenv('VOLCENGINE_ACCESS_KEY'), sk=os.getenv('VOLCENGINE_SECRET_KEY'), host=os.getenv('VOLCENGINE_ENDPOINT')
+# 密码字符分类表：大写/小写/数字/特殊字符分别映射为1~4，其余为0。
+# 一次C层的translate扫描即可统计密码覆盖的字符类别，替代四次正则遍历
+_PW_SPECIAL_CHARS = frozenset(b"!@#$%^&*()_+-=,.&?|/")
+_PW_TABLE = bytes(
+    1 if 65 <= c <= 90 else      # A-Z
+    2 if 97 <= c <= 122 else     # a-z
+    3 if 48 <= c <= 57 else      # 0-9
+    4 if c in _PW_SPECIAL_CHARS else
+    0
+    for c in range(256)
+)
+
+# 校验用的取值集合与对应的提示文案，避免每次调用时重新构造
+_VALID_CHARSETS = frozenset({"utf8", "utf8mb4", "latin1", "ascii"})
+_VALID_CHARSETS_STR = ", ".join(sorted(_VALID_CHARSETS))
+_VALID_ALLOW_LIST_TYPES = frozenset({"IPv4"})
+_VALID_ALLOW_LIST_TYPES_STR = ", ".join(sorted(_VALID_ALLOW_LIST_TYPES))
+_VALID_CATEGORIES = frozenset({"Ordinary", "Default"})
+_VALID_CATEGORIES_STR = ", ".join(sorted(_VALID_CATEGORIES))
+_VALID_ACCOUNT_TYPES = frozenset({"Super", "Normal"})
+_VALID_ACCOUNT_TYPES_STR = ", ".join(sorted(_VALID_ACCOUNT_TYPES))
+
+# describe_db_instances的请求字段名，与handler内的values元组一一对应，
+# 一次zip推导构造出最终dict，避免逐键插入引发的多次扩容
+_DESCRIBE_DB_INSTANCES_KEYS = (
+    "page_number", "page_size", "instance_id", "instance_name", "instance_status",
+    "db_engine_version", "create_time_start", "create_time_end", "zone_id",
+    "charge_type", "instance_type", "node_spec", "tag_filters", "project_name",
+    "private_network_ip_address", "kernel_version", "private_network_vpc_id",
+    "storage_type"
 )
 
+# create_rds_mysql_instance默认参数下复用的共享模板。
+# SDK序列化时只读不改，参数全为默认值时直接引用，免去小dict分配
+_DEFAULT_ZONE = "cn-beijing-a"
+_DEFAULT_NODE_SPEC = "rds.mysql.1c2g"
+_DEFAULT_PRIMARY_NODE = {"NodeType": "Primary", "ZoneId": _DEFAULT_ZONE, "NodeSpec": _DEFAULT_NODE_SPEC}
+_DEFAULT_SECONDARY_NODE = {"NodeType": "Secondary", "ZoneId": _DEFAULT_ZONE, "NodeSpec": _DEFAULT_NODE_SPEC}
+_DEFAULT_READ_ONLY_NODE = {"NodeType": "ReadOnly", "ZoneId": _DEFAULT_ZONE, "NodeSpec": _DEFAULT_NODE_SPEC}
+_DEFAULT_CHARGE_INFO = {"ChargeType": "PostPaid", "AutoRenew": None, "PeriodUnit": None, "Period": None}
+
+# 查询类工具的本地TTL缓存：Agent经常以相同参数反复调用describe_*，
+# TTL内直接命中本地缓存，省去一次火山引擎API的往返
+_CACHE_TTL = 30  # 秒
+_CACHE_MAXSIZE = 1024
+_response_cache: dict = {}
+_response_cache_lock = threading.Lock()
+
+
+def _dedup_preserve_order(items: list) -> list:
+    """去重并保持元素原有顺序，减小请求体和上游解析开销"""
+    return list(dict.fromkeys(items))
+
+
+def _dedup_dicts_preserve_order(items: list) -> list:
+    """对dict列表去重并保持原有顺序，元素不可哈希时原样返回"""
+    try:
+        seen = set()
+        result = []
+        for item in items:
+            marker = frozenset(item.items())
+            if marker not in seen:
+                seen.add(marker)
+                result.append(item)
+        return result
+    except Exception:
+        return items
+
+
+def _ttl_cached(tool_name: str):
+    """为幂等的查询类工具缓存响应，TTL内相同参数的调用直接返回缓存结果"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            # key按排序后的JSON序列化参数构造，保证与参数顺序无关
+            key = (tool_name, _json_dumps({"args": list(args), "kwargs": kwargs}))
+            now = time.monotonic()
+            payload = None
+            with _response_cache_lock:
+                entry = _response_cache.get(key)
+                if entry is not None and entry[0] > now:
+                    payload = entry[1]
+            if payload is not None:
+                # 缓存的是序列化后的bytes，命中时反序列化出全新dict，
+                # 调用方修改返回值不会污染缓存内容
+                return _json_loads(payload)
+            result = await fn(*args, **kwargs)
+            payload = _json_dumps(result)
+            with _response_cache_lock:
+                if len(_response_cache) >= _CACHE_MAXSIZE:
+                    # 缓存满时先清理过期项，仍然满则整体丢弃，避免无界增长
+                    expired = [k for k, v in _response_cache.items() if v[0] <= now]
+                    for k in expired:
+                        del _response_cache[k]
+                    if len(_response_cache) >= _CACHE_MAXSIZE:
+                        _response_cache.clear()
+                _response_cache[key] = (now + _CACHE_TTL, payload)
+            return result
+        return wrapper
+    return decorator
+
+# SDK调度的并发上限，与连接池大小一致；信号量按FIFO唤醒等待者，
+# 并发突发时各工具调用公平排队，不会被线程池的长尾调用饿死
+_SDK_SEMAPHORE = asyncio.Semaphore(32)
+
+
+async def _sdk_call(fn, /, *args, **kwargs):
+    """统一的SDK调度入口：先过信号量再进线程池执行阻塞调用"""
+    async with _SDK_SEMAPHORE:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+@dataclass(slots=True, frozen=True)
+class _Config:
+    """火山引擎访问配置，进程内只读一次环境变量"""
+    region: str
+    ak: Optional[str]
+    sk: Optional[str]
+    host: Optional[str]
+
+
+@functools.lru_cache(maxsize=1)
+def _config() -> _Config:
+    return _Config(
+        region=os.getenv('VOLCENGINE_REGION', "cn-beijing"),
+        ak=os.getenv('VOLCENGINE_ACCESS_KEY'),
+        sk=os.getenv('VOLCENGINE_SECRET_KEY'),
+        host=os.getenv('VOLCENGINE_ENDPOINT')
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _sdk() -> RDSMySQLSDK:
+    """首次使用时才构造SDK客户端，MCP客户端仅做服务发现时不再付初始化成本"""
+    cfg = _config()
+    return RDSMySQLSDK(region=cfg.region, ak=cfg.ak, sk=cfg.sk, host=cfg.host)
+
+
+if hasattr(os, "register_at_fork"):
+    # 多worker场景下fork出的子进程重建客户端，不复用父进程的socket
+    os.register_at_fork(after_in_child=_sdk.cache_clear)
+
+
+def _require(*names: str):
+    """必选参数非空校验。签名在装饰期解析一次，调用期只做绑定与检查"""
+    def decorator(fn):
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            for name in names:
+                if not bound.arguments.get(name):
+                    raise ValueError(f"{name}是必选参数")
+            return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
 @mcp_server.tool(
     name="describe_db_instances",
     description="查询RDS MySQL实例列表"
 )
-def describe_db_instances(
-        page_number: int = Field(default=1, description="当前页页码，取值最小为1"),
-        page_size: int = Field(default=10, description="每页记录数，最小值为1，最大值不超过1000"),
+@_ttl_cached("describe_db_instances")
+async def describe_db_instances(
+        page_number: int = Field(default=1, ge=1, description="当前页页码，取值最小为1"),
+        page_size: int = Field(default=10, ge=1, le=1000, description="每页记录数，最小值为1，最大值不超过1000"),
         instance_id: Optional[str] = Field(default=None, description="实例ID"),
         instance_name: Optional[str] = Field(default=None, description="实例名称"),
         instance_status: Optional[str] = Field(default=None, description="实例状态，如Running、Creating等"),
@@ -62,40 +240,30 @@ def describe_db_instances(
         private_network_vpc_id (str, optional): 私有网络的ID
         storage_type (str, optional): 实例存储类型，如LocalSSD
     """
-    req = {
-        "instance_id": instance_id,
-        "instance_name": instance_name,
-        "instance_status": instance_status,
-        "db_engine_version": db_engine_version,
-        "create_time_start": create_time_start,
-        "create_time_end": create_time_end,
-        "zone_id": zone_id,
-        "charge_type": charge_type,
-        "instance_type": instance_type,
-        "node_spec": node_spec,
-        "tag_filters": tag_filters,
-        "project_name": project_name,
-        "page_number": page_number,
-        "page_size": page_size,
-        "private_network_ip_address": private_network_ip_address,
-        "kernel_version": kernel_version,
-        "private_network_vpc_id": private_network_vpc_id,
-        "storage_type": storage_type
-    }
-
-    req = {k: v for k, v in req.items() if v is not None}
+    if tag_filters is not None and not all(
+            isinstance(filter_item, dict) and 'Key' in filter_item for filter_item in tag_filters):
+        raise ValueError("TagFilters中的每个元素必须是包含Key字段的字典")
 
     if tag_filters is not None:
-        for filter_item in tag_filters:
-            if not isinstance(filter_item, dict) or 'Key' not in filter_item:
-                raise ValueError("TagFilters中的每个元素必须是包含Key字段的字典")
+        tag_filters = _dedup_dicts_preserve_order(tag_filters)
+    if kernel_version is not None:
+        kernel_version = _dedup_preserve_order(kernel_version)
+
+    values = (
+        page_number, page_size, instance_id, instance_name, instance_status,
+        db_engine_version, create_time_start, create_time_end, zone_id,
+        charge_type, instance_type, node_spec, tag_filters, project_name,
+        private_network_ip_address, kernel_version, private_network_vpc_id,
+        storage_type
+    )
+    req = {k: v for k, v in zip(_DESCRIBE_DB_INSTANCES_KEYS, values) if v is not None}
 
-    resp = rds_mysql_resource.describe_db_instances(req)
-    return resp.to_dict()
+    return await _sdk_call(_sdk().describe_db_instances, req, raw=True)
 
 
 @mcp_server.tool(name="describe_db_instance_detail", description="查询RDSMySQL实例详情")
-def describe_db_instance_detail(
+@_ttl_cached("describe_db_instance_detail")
+async def describe_db_instance_detail(
         instance_id: str = Field(description="实例ID")
 ) -> dict[str, Any]:
     """查询RDSMySQL实例详情
@@ -105,15 +273,15 @@ def describe_db_instance_detail(
     req = {
         "instance_id": instance_id,
     }
-    resp = rds_mysql_resource.describe_db_instance_detail(req)
-    return resp.to_dict()
+    return await _sdk_call(_sdk().describe_db_instance_detail, req, raw=True)
 
 
 @mcp_server.tool(
     name="describe_db_instance_engine_minor_versions",
     description="查询RDSMySQL实例可升级的内核小版本"
 )
-def describe_db_instance_engine_minor_versions(
+@_ttl_cached("describe_db_instance_engine_minor_versions")
+async def describe_db_instance_engine_minor_versions(
         instance_ids: List[str] = Field(description="实例ID列表")
 ) -> dict[str, Any]:
     """查询RDSMySQL实例可升级的内核小版本
@@ -124,19 +292,19 @@ def describe_db_instance_engine_minor_versions(
     req = {
         "instance_ids": instance_ids,
     }
-    resp = rds_mysql_resource.describe_db_instance_engine_minor_versions(req)
-    return resp.to_dict()
+    return await _sdk_call(_sdk().describe_db_instance_engine_minor_versions, req, raw=True)
 
 
 @mcp_server.tool(
     name="describe_db_accounts",
     description="查询RDS MySQL实例的数据库账号"
 )
-def describe_db_accounts(
+@_ttl_cached("describe_db_accounts")
+async def describe_db_accounts(
         instance_id: str = Field(description="实例ID"),
         account_name: Optional[str] = Field(default=None, description="数据库账号名称，支持模糊查询"),
-        page_number: int = Field(default=1, description="当前页页码，最小值为1"),
-        page_size: int = Field(default=10, description="每页记录数，范围1-1000")
+        page_number: int = Field(default=1, ge=1, description="当前页页码，最小值为1"),
+        page_size: int = Field(default=10, ge=1, le=1000, description="每页记录数，范围1-1000")
 ) -> dict[str, Any]:
     """查询RDS MySQL实例的数据库账号列表
 
@@ -156,18 +324,18 @@ def describe_db_accounts(
     if account_name is not None:
         req["account_name"] = account_name
 
-    resp = rds_mysql_resource.describe_db_accounts(req)
-    return resp.to_dict()
+    return await _sdk_call(_sdk().describe_db_accounts, req, raw=True)
 
 @mcp_server.tool(
     name="describe_databases",
     description="根据指定RDS MySQL 实例ID 查看数据库列表"
 )
-def describe_databases(
+@_ttl_cached("describe_databases")
+async def describe_databases(
         instance_id: str = Field(description="实例ID"),
         db_name: Optional[str] = Field(default=None, description="数据库名称，支持模糊查询"),
-        page_number: int = Field(default=1, description="当前页页码，最小值为1"),
-        page_size: int = Field(default=10, description="每页记录数，范围1-1000")
+        page_number: int = Field(default=1, ge=1, description="当前页页码，最小值为1"),
+        page_size: int = Field(default=10, ge=1, le=1000, description="每页记录数，范围1-1000")
 ) -> dict[str, Any]:
     """根据指定RDS MySQL 实例ID 查看数据库列表
 
@@ -187,15 +355,15 @@ def describe_databases(
         req["db_name"] = db_name
 
     # 发送请求
-    resp = rds_mysql_resource.describe_databases(req)
-    return resp.to_dict()
+    return await _sdk_call(_sdk().describe_databases, req, raw=True)
 
 
 @mcp_server.tool(
     name="describe_db_instance_parameters",
     description="获取RDS MySQL实例参数列表"
 )
-def describe_db_instance_parameters(
+@_ttl_cached("describe_db_instance_parameters")
+async def describe_db_instance_parameters(
         instance_id: str = Field(description="实例ID"),
         parameter_name: Optional[str] = Field(default=None, description="参数名"),
         node_id: Optional[str] = Field(default=None,
@@ -210,26 +378,27 @@ def describe_db_instance_parameters(
         node_id (str, optional): 查询指定节点的参数设置，如不设置该字段，只返回主节点和备节点的参数设置
     """
     req = {
-        "instance_id": instance_id,
-        "parameter_name": parameter_name,
-        "node_id": node_id
+        "instance_id": instance_id
     }
-    req = {k: v for k, v in req.items() if v is not None}
-    resp = rds_mysql_resource.describe_db_instance_parameters(req)
-    return resp.to_dict()
+    if parameter_name is not None:
+        req["parameter_name"] = parameter_name
+    if node_id is not None:
+        req["node_id"] = node_id
+    return await _sdk_call(_sdk().describe_db_instance_parameters, req, raw=True)
 
 
 @mcp_server.tool(
     name="list_parameter_templates",
     description="查询MySQL实例的参数模板列表"
 )
-def list_parameter_templates(
+@_ttl_cached("list_parameter_templates")
+async def list_parameter_templates(
     template_category: Optional[str] = Field(default=None, description="模板类别，取值为 DBEngine（数据库引擎参数）"),
     template_type: str = Field(default="Mysql", description="参数模板的数据库类型"),
     template_type_version: Optional[str] = Field(default=None, description="参数模板的数据库版本，如 MySQL_5_7 或 MySQL_8_0"),
     template_source: Optional[str] = Field(default=None, description="参数模板来源，取值范围：System（系统）、User（用户）"),
-    limit: int = Field(default=10, description="每页记录数，范围1-100"),
-    offset: int = Field(default=0, description="当前页查询偏移量"),
+    limit: int = Field(default=10, ge=1, le=100, description="每页记录数，范围1-100"),
+    offset: int = Field(default=0, ge=0, description="当前页查询偏移量"),
     project_name: Optional[str] = Field(default=None, description="所属项目名称"),
     template_name: Optional[str] = Field(default=None, description="模板名称")
 ) -> dict[str, Any]:
@@ -247,32 +416,31 @@ def list_parameter_templates(
         template_name (str, optional): 模板名称
     """
     req = {
-        "template_category": template_category,
         "template_type": template_type,
-        "template_type_version": template_type_version,
-        "template_source": template_source,
         "limit": limit,
-        "offset": offset,
-        "project_name": project_name,
-        "template_name": template_name
+        "offset": offset
     }
-    req = {k: v for k, v in req.items() if v is not None}
-
-    if 'Limit' in req and not (1 <= req['Limit'] <= 100):
-        raise ValueError("Limit参数必须在1-100之间")
-
-    if 'Offset' in req and req['Offset'] < 0:
-        raise ValueError("Offset参数必须大于等于0")
+    if template_category is not None:
+        req["template_category"] = template_category
+    if template_type_version is not None:
+        req["template_type_version"] = template_type_version
+    if template_source is not None:
+        req["template_source"] = template_source
+    if project_name is not None:
+        req["project_name"] = project_name
+    if template_name is not None:
+        req["template_name"] = template_name
 
-    resp = rds_mysql_resource.list_parameter_templates(req)
-    return resp.to_dict()
+    return await _sdk_call(_sdk().list_parameter_templates, req, raw=True)
 
 
 @mcp_server.tool(
     name="describe_parameter_template",
     description="查询指定的参数模板详情"
 )
-def describe_parameter_template(
+@_ttl_cached("describe_parameter_template")
+@_require("template_id")
+async def describe_parameter_template(
         template_id: str = Field(description="参数模板 ID"),
         project_name: Optional[str] = Field(default=None, description="所属项目名称")
 ) -> dict[str, Any]:
@@ -284,23 +452,20 @@ def describe_parameter_template(
         project_name (str, optional): 所属项目名称
     """
     req = {
-        "template_id": template_id,
-        "project_name": project_name
+        "template_id": template_id
     }
-    req = {k: v for k, v in req.items() if v is not None}
-
-    if not template_id:
-        raise ValueError("template_id是必选参数")
+    if project_name is not None:
+        req["project_name"] = project_name
 
-    resp = rds_mysql_resource.describe_parameter_template(req)
-    return resp.to_dict()
+    return await _sdk_call(_sdk().describe_parameter_template, req, raw=True)
 
 
 @mcp_server.tool(
     name="describe_db_instance_price_detail",
     description="查询数据库实例价格详情"
 )
-def describe_db_instance_price_detail(
+@_require("node_info", "storage_type", "charge_type")
+async def describe_db_instance_price_detail(
         node_info: list[dict[str, Any]] = Field(description="实例的节点配置列表，每个节点配置包含NodeType、NodeSpec等字段"),
         storage_type: str = Field(description="实例存储类型，取值为 LocalSSD，表示本地 SSD 盘"),
         storage_space: int = Field(description="实例存储空间，取值范围：[20, 3000]，单位：GB，步长 10GB"),
@@ -335,37 +500,35 @@ def describe_db_instance_price_detail(
         "node_info": node_info,
         "storage_type": storage_type,
         "storage_space": storage_space,
-        "charge_type": charge_type,
-        "node_id": node_id,
-        "zone_id": zone_id,
-        "period_unit": period_unit,
-        "period": period,
-        "number": number,
-        "project_name": project_name,
+        "charge_type": charge_type
     }
-    req = {k: v for k, v in req.items() if v is not None}
+    if node_id is not None:
+        req["node_id"] = node_id
+    if zone_id is not None:
+        req["zone_id"] = zone_id
+    if period_unit is not None:
+        req["period_unit"] = period_unit
+    if period is not None:
+        req["period"] = period
+    if number is not None:
+        req["number"] = number
+    if project_name is not None:
+        req["project_name"] = project_name
 
-    # 必选参数校验
-    if not node_info:
-        raise ValueError("node_info是必选参数")
     if not all(
         node.get("NodeType") in ["Primary", "Secondary", "ReadOnly"] and
         node.get("NodeSpec")
         for node in node_info
     ):
         raise ValueError("node_info中的每个节点必须包含有效的NodeType和NodeSpec字段")
-    if not storage_type:
-        raise ValueError("storage_type是必选参数")
     if storage_space is None or not (20 <= storage_space <= 3000 and storage_space % 10 == 0):
         raise ValueError("storage_space是必选参数，取值范围：[20, 3000]，步长10GB")
-    if not charge_type:
-        raise ValueError("charge_type是必选参数")
     if charge_type == "PrePaid" and (period_unit is None or period is None):
         raise ValueError("预付费模式下period_unit和period是必选参数")
     if node_operate_type and node_operate_type not in ["Create", "Modify"]:
         raise ValueError("node_operate_type必须是Create或Modify")
 
-    resp = rds_mysql_resource.describe_db_instance_price_detail(req)
+    resp = await _sdk_call(_sdk().describe_db_instance_price_detail, req)
     return resp.to_dict()
 
 
@@ -373,9 +536,11 @@ def describe_db_instance_price_detail(
     name="modify_db_instance_name",
     description="修改RDS MySQL实例名称"
 )
-def modify_db_instance_name(
+@_require("instance_id")
+async def modify_db_instance_name(
         instance_id: str = Field(description="实例 ID"),
         instance_new_name: str = Field(
+            pattern=r'^[^\d-][\w\-一-龥]{0,127}$',
             description="实例的新名称。命名规则：不能以数字、中划线开头，只能包含中文、字母、数字、下划线和中划线，长度限制在 1~128 之间")
 ) -> dict[str, Any]:
     """
@@ -388,22 +553,12 @@ def modify_db_instance_name(
             - 只能包含中文、字母、数字、下划线和中划线
             - 长度限制在 1~128 之间
     """
-    if not instance_id:
-        raise ValueError("instance_id是必选参数")
-
-    if not instance_new_name:
-        raise ValueError("instance_new_name是必选参数")
-
-    import re
-    if not re.match(r'^[^\d-][\w\-\u4e00-\u9fa5]{0,127}$', instance_new_name):
-        raise ValueError("实例名称不符合命名规则：不能以数字、中划线开头，只能包含中文、字母、数字、下划线和中划线，长度1~128")
-
     req = {
         "instance_id": instance_id,
         "instance_new_name": instance_new_name
     }
 
-    resp = rds_mysql_resource.modify_db_instance_name(req)
+    resp = await _sdk_call(_sdk().modify_db_instance_name, req)
     return resp.to_dict()
 
 
@@ -411,11 +566,12 @@ def modify_db_instance_name(
     name="modify_db_account_description",
     description="修改RDS MySQL实例账号的描述信息"
 )
-def modify_db_account_description(
+@_require("instance_id", "account_name")
+async def modify_db_account_description(
         instance_id: str = Field(description="实例 ID"),
         account_name: str = Field(description="数据库账号名称"),
         host: str = Field(default="%", description="指定账号访问数据库的 IP 地址，默认值为 %"),
-        account_desc: Optional[str] = Field(default=None, description="数据库账号的描述信息，长度不超过 256 个字符")
+        account_desc: Optional[str] = Field(default=None, max_length=256, description="数据库账号的描述信息，长度不超过 256 个字符")
 ) -> dict[str, Any]:
     """
     修改RDS MySQL实例账号的描述信息
@@ -432,25 +588,15 @@ def modify_db_account_description(
         account_desc (str, optional): 数据库账号的描述信息，长度不超过 256 个字符。
             - 该字段可选，如果不设置该字段，或者设置了该字段但传入空字符串（即长度为 0），则会清空原有备注
     """
-    if not instance_id:
-        raise ValueError("instance_id是必选参数")
-
-    if not account_name:
-        raise ValueError("account_name是必选参数")
-
-    if account_desc is not None and len(account_desc) > 256:
-        raise ValueError("account_desc长度不能超过256个字符")
-
     req = {
         "instance_id": instance_id,
         "account_name": account_name,
-        "host": host,
-        "account_desc": account_desc
+        "host": host
     }
+    if account_desc is not None:
+        req["account_desc"] = account_desc
 
-    req = {k: v for k, v in req.items() if v is not None}
-
-    resp = rds_mysql_resource.modify_db_account_description(req)
+    resp = await _sdk_call(_sdk().modify_db_account_description, req)
     return resp.to_dict()
 
 
@@ -507,29 +653,44 @@ async def create_rds_mysql_instance(
     
     通过max_wait_time参数可控制最长等待时间，默认为10分钟，一般大多数实例3-5分钟可创建完成，复杂实例可能需要更长时间。
     """
-    node_info = []
-
-    node_info.append({
-        "NodeType": "Primary",
-        "ZoneId": primary_zone,
-        "NodeSpec": primary_spec
-    })
-
-    for i in range(secondary_count):
-        zone = secondary_zone or primary_zone
-        node_info.append({
+    # 同类节点共享同一个dict模板，SDK序列化时只读不改，无需逐个拷贝；
+    # 取值与默认配置一致时直接复用模块级常量
+    if primary_zone == _DEFAULT_ZONE and primary_spec == _DEFAULT_NODE_SPEC:
+        primary_node = _DEFAULT_PRIMARY_NODE
+    else:
+        primary_node = {
+            "NodeType": "Primary",
+            "ZoneId": primary_zone,
+            "NodeSpec": primary_spec
+        }
+    secondary_zone = secondary_zone or primary_zone
+    if secondary_zone == _DEFAULT_ZONE and secondary_spec == _DEFAULT_NODE_SPEC:
+        secondary_node = _DEFAULT_SECONDARY_NODE
+    else:
+        secondary_node = {
             "NodeType": "Secondary",
-            "ZoneId": zone,
+            "ZoneId": secondary_zone,
             "NodeSpec": secondary_spec
-        })
-
-
-    for i in range(read_only_count):
-        node_info.append({
+        }
+    if read_only_zone == _DEFAULT_ZONE and read_only_spec == _DEFAULT_NODE_SPEC:
+        read_only_node = _DEFAULT_READ_ONLY_NODE
+    else:
+        read_only_node = {
             "NodeType": "ReadOnly",
             "ZoneId": read_only_zone,
             "NodeSpec": read_only_spec
-        })
+        }
+    node_info = [primary_node] + [secondary_node] * secondary_count + [read_only_node] * read_only_count
+
+    if charge_type == "PostPaid" and auto_renew is None and period_unit is None and period is None:
+        charge_info = _DEFAULT_CHARGE_INFO
+    else:
+        charge_info = {
+            "ChargeType": charge_type,
+            "AutoRenew": auto_renew,
+            "PeriodUnit": period_unit,
+            "Period": period
+        }
 
     data = {
         "db_engine_version": db_engine_version,
@@ -541,12 +702,7 @@ async def create_rds_mysql_instance(
         "instance_type": instance_type,
         "lower_case_table_names": lower_case_table_names,
         "port": port,
-        "charge_info": {
-            "ChargeType": charge_type,
-            "AutoRenew": auto_renew,
-            "PeriodUnit": period_unit,
-            "Period": period
-        }
+        "charge_info": charge_info
     }
 
 
@@ -569,7 +725,7 @@ async def create_rds_mysql_instance(
         data["project_name"] = project_name
 
     if allow_list_ids is not None:
-        data["allow_list_ids"] = allow_list_ids
+        data["allow_list_ids"] = _dedup_preserve_order(allow_list_ids)
 
     if instance_tags is not None:
         data["instance_tags"] = instance_tags
@@ -577,7 +733,7 @@ async def create_rds_mysql_instance(
     if maintenance_window is not None:
         data["maintenance_window"] = maintenance_window
 
-    create_resp = rds_mysql_resource.create_db_instance(data)
+    create_resp = await _sdk_call(_sdk().create_db_instance, data)
     
     instance_id = create_resp.instance_id
     
@@ -626,7 +782,7 @@ async def create_rds_mysql_instance(
                        f"waited {wait_interval}s, total time: {time_spent}s")
             
             req = {"instance_id": instance_id}
-            detail_resp = rds_mysql_resource.describe_db_instance_detail(req)
+            detail_resp = await _sdk_call(_sdk().describe_db_instance_detail, req)
             detail = detail_resp.to_dict()
             
             # 从响应中提取实例状态
@@ -662,12 +818,13 @@ async def create_rds_mysql_instance(
     name="create_database",
     description="创建RDS MySQL实例数据库"
 )
-def create_database(
+@_require("instance_id", "db_name")
+async def create_database(
         instance_id: str = Field(description="实例 ID"),
         db_name: str = Field(description="数据库名称。命名规则：名称唯一，长度为 2~64 个字符，以字母开头，以字母或数字结尾，由字母、数字、下划线或中划线组成，不能使用预留字"),
         character_set_name: str = Field(default="utf8mb4", description="数据库字符集，支持：utf8、utf8mb4、latin1、ascii"),
         database_privileges: Optional[List[Dict]] = Field(default=None, description="授权数据库权限信息"),
-        db_desc: Optional[str] = Field(default=None, description="数据库的描述信息，长度不超过 256 个字符")
+        db_desc: Optional[str] = Field(default=None, max_length=256, description="数据库的描述信息，长度不超过 256 个字符")
 ) -> dict[str, Any]:
     """
     创建RDS MySQL实例数据库
@@ -688,30 +845,20 @@ def create_database(
             - AccountPrivilegeDetail (str, optional): 当 AccountPrivilege 为 Custom 时必填，指定具体权限
         db_desc (str, optional): 数据库的描述信息，长度不超过 256 个字符
     """
-    if not instance_id:
-        raise ValueError("instance_id是必选参数")
-
-    if not db_name:
-        raise ValueError("db_name是必选参数")
-
-    valid_charsets = {"utf8", "utf8mb4", "latin1", "ascii"}
-    if character_set_name not in valid_charsets:
-        raise ValueError(f"无效的字符集: {character_set_name}，支持的字符集为: {', '.join(valid_charsets)}")
-
-    if db_desc is not None and len(db_desc) > 256:
-        raise ValueError("db_desc长度不能超过256个字符")
+    if character_set_name not in _VALID_CHARSETS:
+        raise ValueError(f"无效的字符集: {character_set_name}，支持的字符集为: {_VALID_CHARSETS_STR}")
 
     req = {
         "instance_id": instance_id,
         "db_name": db_name,
-        "character_set_name": character_set_name,
-        "database_privileges": database_privileges,
-        "db_desc": db_desc
+        "character_set_name": character_set_name
     }
+    if database_privileges is not None:
+        req["database_privileges"] = database_privileges
+    if db_desc is not None:
+        req["db_desc"] = db_desc
 
-    req = {k: v for k, v in req.items() if v is not None}
-
-    resp = rds_mysql_resource.create_database(req)
+    resp = await _sdk_call(_sdk().create_database, req)
     if resp is None:
         return {
             "Message": "Success"
@@ -722,12 +869,13 @@ def create_database(
     name="create_allow_list",
     description="创建RDS MySQL实例白名单"
 )
-def create_allow_list(
-        allow_list_name: str = Field(..., title="白名单名称", description="需满足：不能以数字或中划线（-）开头，只能包含中文、字母、数字、下划线（_）和中划线（-），长度需为 1~128 个字符"),
-        allow_list_desc: str = Field(None, description="长度不可超过 200 个字符"),
+@_require("allow_list_name")
+async def create_allow_list(
+        allow_list_name: str = Field(..., title="白名单名称", pattern=r'^[^\d-][\w\-一-龥]{0,127}$', description="需满足：不能以数字或中划线（-）开头，只能包含中文、字母、数字、下划线（_）和中划线（-），长度需为 1~128 个字符"),
+        allow_list_desc: str = Field(None, max_length=200, description="长度不可超过 200 个字符"),
         allow_list_type: str = Field("IPv4", description="白名单内的 IP 地址类型，当前仅支持 IPv4 地址"),
         allow_list: str = Field(None, description="输入 IP 地址或 CIDR 格式的 IP 地址段，多个地址间用英文逗号（,）隔开，每个白名单分组中最多支持设置 300 个 IP 地址或 CIDR 格式的 IP 地址段，不允许设置重复的地址，该字段不能与 UserAllowList 字段同时使用"),
-        security_group_ids: list[str] = Field(None, description="需要关联的安全组 ID 列表，单个白名单单次最多可选择添加 10 个安全组，该字段不能与 SecurityGroupBindInfos 同时使用"),
+        security_group_ids: list[str] = Field(None, max_length=10, description="需要关联的安全组 ID 列表，单个白名单单次最多可选择添加 10 个安全组，该字段不能与 SecurityGroupBindInfos 同时使用"),
         security_group_bind_infos: list[dict] = Field(None, description="白名单关联的安全组的信息，每个信息包含：BindMode (str): 关联安全组的模式，取值：IngressDirectionIp（入方向 IP）、AssociateEcsIp（关联 ECSIP）；SecurityGroupId (str): 安全组 ID；IpList (list[str], optional): 安全组的 IP；SecurityGroupName (str, optional): 安全组名称；该字段不能与 SecurityGroupIds 同时使用"),
         allow_list_category: str = Field("Ordinary", description="白名单分类，取值：Ordinary（普通白名单）、Default（默认白名单），默认值为 Ordinary"),
         user_allow_list: str = Field(None, description="安全组之外的、需要加入白名单的 IP 地址，可输入 IP 地址或 CIDR 格式的 IP 地址段，该字段不能与 AllowList 字段同时使用"),
@@ -760,30 +908,14 @@ def create_allow_list(
             - 该字段不能与 AllowList 字段同时使用
         project_name (str, optional): 所属的项目
     """
-    # 验证必选参数
-    if not allow_list_name:
-        raise ValueError("allow_list_name是必选参数")
-
-    # 验证白名单名称格式
-    import re
-    if not re.match(r'^[^\d-][\w\-\u4e00-\u9fa5]{0,127}$', allow_list_name):
-        raise ValueError(
-            "白名单名称不符合命名规则：不能以数字或中划线开头，只能包含中文、字母、数字、下划线和中划线，长度1~128")
-
-    # 验证描述信息长度
-    if allow_list_desc is not None and len(allow_list_desc) > 200:
-        raise ValueError("allow_list_desc长度不能超过200个字符")
-
     # 验证IP地址类型
-    valid_allow_list_types = {"IPv4"}
-    if allow_list_type not in valid_allow_list_types:
-        raise ValueError(f"无效的allow_list_type: {allow_list_type}，支持的类型为: {', '.join(valid_allow_list_types)}")
+    if allow_list_type not in _VALID_ALLOW_LIST_TYPES:
+        raise ValueError(f"无效的allow_list_type: {allow_list_type}，支持的类型为: {_VALID_ALLOW_LIST_TYPES_STR}")
 
     # 验证白名单分类
-    valid_categories = {"Ordinary", "Default"}
-    if allow_list_category not in valid_categories:
+    if allow_list_category not in _VALID_CATEGORIES:
         raise ValueError(
-            f"无效的allow_list_category: {allow_list_category}，支持的分类为: {', '.join(valid_categories)}")
+            f"无效的allow_list_category: {allow_list_category}，支持的分类为: {_VALID_CATEGORIES_STR}")
 
     # 验证AllowList和UserAllowList不能同时存在
     if allow_list is not None and user_allow_list is not None:
@@ -793,26 +925,26 @@ def create_allow_list(
     if security_group_ids is not None and security_group_bind_infos is not None:
         raise ValueError("security_group_ids和security_group_bind_infos字段不能同时使用")
 
-    # 验证SecurityGroupIds长度
-    if security_group_ids is not None and len(security_group_ids) > 10:
-        raise ValueError("security_group_ids最多只能包含10个安全组ID")
-
     req = {
         "allow_list_name": allow_list_name,
-        "allow_list_desc": allow_list_desc,
         "allow_list_type": allow_list_type,
-        "allow_list": allow_list,
-        "security_group_ids": security_group_ids,
-        "security_group_bind_infos": security_group_bind_infos,
-        "allow_list_category": allow_list_category,
-        "user_allow_list": user_allow_list,
-        "project_name": project_name
+        "allow_list_category": allow_list_category
     }
-
-    req = {k: v for k, v in req.items() if v is not None}
+    if allow_list_desc is not None:
+        req["allow_list_desc"] = allow_list_desc
+    if allow_list is not None:
+        req["allow_list"] = allow_list
+    if security_group_ids is not None:
+        req["security_group_ids"] = _dedup_preserve_order(security_group_ids)
+    if security_group_bind_infos is not None:
+        req["security_group_bind_infos"] = _dedup_dicts_preserve_order(security_group_bind_infos)
+    if user_allow_list is not None:
+        req["user_allow_list"] = user_allow_list
+    if project_name is not None:
+        req["project_name"] = project_name
 
     # 调用接口
-    resp = rds_mysql_resource.create_allow_list(req)
+    resp = await _sdk_call(_sdk().create_allow_list, req)
     return resp.to_dict()
 
 
@@ -820,7 +952,8 @@ def create_allow_list(
     name="associate_allow_list",
     description="绑定RDS MySQL实例与白名单"
 )
-def associate_allow_list(
+@_require("instance_ids", "allow_list_ids")
+async def associate_allow_list(
     instance_ids: list[str] = Field(
             title="实例ID列表",
             description=(
@@ -830,8 +963,7 @@ def associate_allow_list(
                 "  - 将多个实例同时绑定到同一个白名单（此时allow_list_ids长度应为1）\n"
                 "  - 或将一个实例同时绑定到多个白名单（此时instance_ids长度应为1）"
             ),
-            min_items=1,
-            max_items=200
+            min_items=1
         ),
     allow_list_ids: list[str] = Field(
             title="白名单ID列表",
@@ -842,8 +974,7 @@ def associate_allow_list(
                 "  - 将多个实例同时绑定到同一个白名单（此时allow_list_ids长度应为1）\n"
                 "  - 或将一个实例同时绑定到多个白名单（此时instance_ids长度应为1）"
             ),
-            min_items=1,
-            max_items=100
+            min_items=1
         )
 ) -> dict[str, Any]:
     """
@@ -861,11 +992,9 @@ def associate_allow_list(
                 - 将多个实例同时绑定到同一个白名单（此时 allow_list_ids 长度应为 1）
                 - 或将一个实例同时绑定到多个白名单（此时 instance_ids 长度应为 1）
     """
-    if not instance_ids:
-        raise ValueError("instance_ids是必选参数，不能为空列表")
-
-    if not allow_list_ids:
-        raise ValueError("allow_list_ids是必选参数，不能为空列表")
+    # 去重后再校验，重复传入的ID不应占用数量限额
+    instance_ids = _dedup_preserve_order(instance_ids)
+    allow_list_ids = _dedup_preserve_order(allow_list_ids)
 
     if len(instance_ids) > 200:
         raise ValueError("单次最多可传入200个实例ID")
@@ -882,7 +1011,7 @@ def associate_allow_list(
         "allow_list_ids": allow_list_ids
     }
 
-    resp = rds_mysql_resource.associate_allow_list(req)
+    resp = await _sdk_call(_sdk().associate_allow_list, req)
     if resp is None:
         return {
             "Message": "Success"
@@ -893,7 +1022,8 @@ def associate_allow_list(
     name="create_db_account",
     description="创建RDS MySQL实例数据库账号"
 )
-def create_db_account(
+@_require("instance_id", "account_name", "account_password", "account_type")
+async def create_db_account(
     instance_id: str = Field(
             title="实例ID",
             description="需要创建账号的RDS MySQL实例ID"
@@ -907,7 +1037,8 @@ def create_db_account(
                 "- 由字母、数字、下划线（_）和中划线（-）组成\n"
                 "- 账号名称在实例内必须唯一\n"
                 "- 不能使用某些预留字（高权限账号除外）"
-            )
+            ),
+            pattern=r'^[a-zA-Z][a-zA-Z0-9_-]{0,30}[a-zA-Z0-9]$'
         ),
     account_password: str = Field(
             title="数据库账号密码",
@@ -916,7 +1047,9 @@ def create_db_account(
                 "- 长度为8~32个字符\n"
                 "- 由大写字母、小写字母、数字、特殊字符中的至少三种组成\n"
                 "- 特殊字符为!@#$%^&*()_+-=,.&?|/"
-            )
+            ),
+            min_length=8,
+            max_length=32
         ),
     account_type:  str = Field(
             title="数据库账号类型",
@@ -1000,61 +1133,35 @@ def create_db_account(
                 - ColumnName (str): 列名
                 - AccountPrivilegeDetail (str): 列权限，如 "UPDATE,INSERT"
     """
-    if not instance_id:
-        raise ValueError("instance_id是必选参数")
 
-    if not account_name:
-        raise ValueError("account_name是必选参数")
-
-    if not account_password:
-        raise ValueError("account_password是必选参数")
-
-    if not account_type:
-        raise ValueError("account_type是必选参数")
-
-    import re
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]{0,30}[a-zA-Z0-9]$', account_name):
-        raise ValueError(
-            "账号名称不符合命名规则：长度为2~32个字符，以字母开头，以字母或数字结尾，由字母、数字、下划线或中划线组成")
-
-    if not (8 <= len(account_password) <= 32):
-        raise ValueError("密码长度必须为8~32个字符")
-
-    conditions = [
-        bool(re.search(r'[A-Z]', account_password)),  # 大写字母
-        bool(re.search(r'[a-z]', account_password)),  # 小写字母
-        bool(re.search(r'[0-9]', account_password)),  # 数字
-        bool(re.search(r'[!@#$%^&*()_+\-=,.&?|/]', account_password))  # 特殊字符
-    ]
-
-    if sum(conditions) < 3:
+    # 非ASCII字符不属于任何类别，编码时直接忽略
+    classes = set(account_password.encode('ascii', 'ignore').translate(_PW_TABLE))
+    classes.discard(0)
+    if len(classes) < 3:
         raise ValueError("密码必须包含大写字母、小写字母、数字、特殊字符中的至少三种")
 
-    valid_account_types = {"Super", "Normal"}
-    if account_type not in valid_account_types:
-        raise ValueError(f"无效的account_type: {account_type}，支持的类型为: {', '.join(valid_account_types)}")
+    if account_type not in _VALID_ACCOUNT_TYPES:
+        raise ValueError(f"无效的account_type: {account_type}，支持的类型为: {_VALID_ACCOUNT_TYPES_STR}")
 
     if account_type == "Super" and host != "%":
         raise ValueError("当account_type为Super时，Host的取值只能为%")
 
-    if account_desc is not None and len(account_desc) > 256:
-        raise ValueError("account_desc长度不能超过256个字符")
-
     req = {
         "instance_id": instance_id,
         "account_name": account_name,
-        "account_desc": account_desc,
         "host": host,
         "account_password": account_password,
         "account_type": account_type,
-        "account_privileges": account_privileges,
-        "dry_run": dry_run,
-        "table_column_privileges": table_column_privileges
+        "dry_run": dry_run
     }
-
-    req = {k: v for k, v in req.items() if v is not None}
-
-    resp = rds_mysql_resource.create_db_account(req)
+    if account_desc is not None:
+        req["account_desc"] = account_desc
+    if account_privileges is not None:
+        req["account_privileges"] = account_privileges
+    if table_column_privileges is not None:
+        req["table_column_privileges"] = table_column_privileges
+
+    resp = await _sdk_call(_sdk().create_db_account, req)
     if resp is None:
         return {
             "Message": "Success"
@@ -1066,9 +1173,11 @@ def create_db_account(
     name="describe_vpcs",
     description="查询VPC 信息，用于创建实例"
 )
-def describe_vpcs(
-        page_number: int = Field(default=1, description="当前页页码，最小值为1"),
-        page_size: int = Field(default=5, description="每页记录数，范围1-1000")
+@_ttl_cached("describe_vpcs")
+async def describe_vpcs(
+        page_number: int = Field(default=1, ge=1, description="当前页页码，最小值为1"),
+        page_size: int = Field(default=5, ge=1, le=1000, description="每页记录数，范围1-1000"),
+        vpc_ids: Optional[List[str]] = Field(default=None, description="按VPC ID列表过滤，单次最多支持100个")
 ) -> dict[str, Any]:
     if not page_number:
         page_number = 1
@@ -1078,15 +1187,15 @@ def describe_vpcs(
         "page_number": page_number,
         "page_size": page_size
     }
-    req = {k: v for k, v in req.items() if v is not None}
-    resp = rds_mysql_resource.describe_vpcs(req)
-    return resp.to_dict()
+    if vpc_ids:
+        req["vpc_ids"] = _dedup_preserve_order(vpc_ids)
+    return await _sdk_call(_sdk().describe_vpcs, req, raw=True)
 
 @mcp_server.tool(
     name="describe_subnets",
     description="查询子网信息，用于创建实例"
 )
-def describe_subnets(
+async def describe_subnets(
         vpc_id: str = Field(
             ...,
             description="VPC ID",
@@ -1100,9 +1209,7 @@ def describe_subnets(
         "vpc_id": vpc_id,
         "zone_id": zone_id,
     }
-    req = {k: v for k, v in req.items() if v is not None}
-    resp = rds_mysql_resource.describe_subnets(req)
-    return resp.to_dict()
+    return await _sdk_call(_sdk().describe_subnets, req, raw=True)
 
 def main():
     """Main entry point for the MCP server."""